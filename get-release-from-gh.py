@@ -1,6 +1,28 @@
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from github import Github
+
+REPO_NAME = "riscv-admin/bod-report"
+LATEST_RELEASE_URL = f"https://api.github.com/repos/{REPO_NAME}/releases/latest"
+
+# Sidecar file remembering the validators of previously downloaded assets
+ETAG_CACHE_FILE = '.etag-cache.json'
+
+# Upper bound on parallel asset downloads, to stay clear of GitHub abuse detection
+MAX_DOWNLOAD_WORKERS = 8
+
+# Asset bodies are streamed to disk in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Suffix of the temp file an asset is downloaded to before replacing the CSV
+PART_SUFFIX = '.part'
+
+# Shared by all download threads so TLS handshakes are amortized across assets;
+# compressed responses are requested explicitly and decoded by requests
+http_session = requests.Session()
+http_session.headers['Accept-Encoding'] = 'gzip, deflate'
 
 # Ensure the GitHub token is set as an environment variable
 def get_github_token():
@@ -9,51 +31,95 @@ def get_github_token():
         raise EnvironmentError("GITHUB_TOKEN is not set. Please set it as an environment variable.")
     return token
 
-# Authenticate to GitHub
-def authenticate_to_github(token):
-    return Github(token)
-
-# Fetch the latest release of the specified repository
-def get_latest_release(repo):
-    return repo.get_latest_release()
+# Fetch the latest release of the repository, assets included, in a single REST call
+def get_latest_release(token):
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github+json"
+    }
+    response = http_session.get(LATEST_RELEASE_URL, headers=headers)
+    response.raise_for_status()  # Raise an HTTPError if the request failed
+    return response.json()
 
 # Filter assets to get CSV files matching a specific pattern
 def get_csv_assets(release):
     return [
-        asset for asset in release.get_assets()
-        if asset.name.startswith('specs_') and asset.name.endswith('.csv')
+        asset for asset in release.get('assets', [])
+        if asset['name'].startswith('specs_') and asset['name'].endswith('.csv')
     ]
 
-# Download a file from a given asset URL
-def download_asset(asset, token):
-    print(f"Downloading {asset.name} from {asset.url}")
+# Load the ETag sidecar, mapping asset ids to {etag, last_modified, local_path}
+def load_etag_cache(path=ETAG_CACHE_FILE):
+    try:
+        with open(path, 'r') as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+# Persist the ETag sidecar atomically so an interrupted run never corrupts it
+def save_etag_cache(etag_cache, path=ETAG_CACHE_FILE):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as file:
+        json.dump(etag_cache, file, indent=2)
+    os.replace(tmp_path, path)
+
+# Download a file from a given asset URL, skipping the body if it is unchanged.
+# Returns True when a new copy was written, False when the local copy was reused.
+def download_asset(asset, token, etag_cache):
+    print(f"Downloading {asset['name']} from {asset['url']}")
     headers = {
         "Authorization": f"token {token}",
         "Accept": "application/octet-stream"
     }
-    response = requests.get(asset.url, headers=headers)
-    response.raise_for_status()  # Raise an HTTPError if the request failed
-    with open(asset.name, 'wb') as file:
-        file.write(response.content)
-    print(f"Downloaded {asset.name}")
+    # An entry without a local copy carries no usable validators
+    cached = etag_cache.get(str(asset['id']))
+    if cached and cached.get('local_path') and os.path.exists(cached['local_path']):
+        if cached.get('etag'):
+            headers["If-None-Match"] = cached['etag']
+        if cached.get('last_modified'):
+            headers["If-Modified-Since"] = cached['last_modified']
+
+    with http_session.get(asset['url'], headers=headers, stream=True) as response:
+        if response.status_code == 304:
+            print(f"{asset['name']} is unchanged, reusing {cached['local_path']}")
+            return False
+        response.raise_for_status()  # Raise an HTTPError if the request failed
+        # Stream into a temp file and swap it in only once complete, so a failed
+        # download never leaves a truncated CSV behind the old validators
+        part_path = asset['name'] + PART_SUFFIX
+        try:
+            with open(part_path, 'wb') as file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    file.write(chunk)
+            os.replace(part_path, asset['name'])
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        etag_cache[str(asset['id'])] = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'local_path': asset['name'],
+        }
+    print(f"Downloaded {asset['name']}")
+    return True
 
 # Main function to orchestrate the workflow
 def main():
     token = get_github_token()
-    github_client = authenticate_to_github(token)
-
-    repo_name = "riscv-admin/bod-report"
-    repo = github_client.get_repo(repo_name)
 
-    latest_release = get_latest_release(repo)
-    print("Latest release information:", latest_release)
+    latest_release = get_latest_release(token)
+    print("Latest release information:", latest_release.get('tag_name'))
 
     csv_assets = get_csv_assets(latest_release)
     if not csv_assets:
         raise Exception("No CSV assets found in the latest release.")
 
-    for asset in csv_assets:
-        download_asset(asset, token)
+    # Each worker updates its own asset's entry, so the shared dict needs no lock
+    etag_cache = load_etag_cache()
+    with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(csv_assets))) as executor:
+        list(executor.map(lambda asset: download_asset(asset, token, etag_cache), csv_assets))
+    save_etag_cache(etag_cache)
 
     print("All downloads completed successfully.")
 
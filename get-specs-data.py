@@ -3,24 +3,24 @@ This script fetches data from a JIRA project and writes it to a CSV file.
 The JIRA issues are retrieved using a JIRA Query Language (JQL) query,
 and the data is written to a CSV file named with the current date and time.
 
+Fetching, parsing and writing live in jira_export.py; this script only
+describes which issues and columns make up the BoD report.
+
 Author: Rafael Sene, rafael@riscv.org - Initial implementation
 """
 
-import csv
 import os
 from datetime import datetime
-from atlassian import Jira
+from jira_export import export, extract_field_value
 
+# Placeholder written for custom fields that have not been filled in
+NOT_SET = "Not Set Yet"
 
-def extract_field_value(value):
-    if value is None:
-        return ""
-    if isinstance(value, dict):
-        return value.get('value') or value.get('name') or value.get('label') or ""
-    if isinstance(value, list):
-        parts = [extract_field_value(item) for item in value]
-        return ", ".join([part for part in parts if part])
-    return str(value)
+# JQL query to fetch required issues
+JQL = ('project = RVS AND '
+       'issuetype not in subTaskIssueTypes() AND '
+       'status not in ("Specification Ratified", "Specification Not Ratified") '
+       'ORDER BY priority DESC, updated DESC')
 
 
 def normalize_bod_report_value(value):
@@ -35,58 +35,25 @@ def normalize_bod_report_value(value):
     return text
 
 
-# Function to parse and extract issue details
-def parse_issues(issues):
-    parsed_issues = []
-    for issue in issues:
-        issue_id = issue.get('id')
-        issue_key = issue.get('key')
-        fields = issue.get('fields', {})
-
-        # Extracting various fields from the issue
-        url = "https://riscv.atlassian.net/browse/" + issue_key
-        summary = fields.get('summary')
-        status = fields.get('status', {}).get('name')
-        isa_or_non_isa = fields.get('customfield_10042', {}).get('value')
-        updated = fields.get('updated')
-
-        # Safely accessing custom fields with a fallback to "Not Planned Yet" if None
-        baseline_ratification_quarter = (
-            fields.get('customfield_10039', {}).get('value') if fields.get('customfield_10039') else "Not Set Yet"
-        )
-        target_ratification_quarter = (
-            fields.get('customfield_10040', {}).get('value') if fields.get('customfield_10040') else "Not Set Yet"
-        )
-        ratification_progress = (
-            "Not Set Yet" if fields.get('customfield_10038') is None or fields.get('customfield_10038', {}).get('value') in [None, "Not Set"]
-            else fields.get('customfield_10038', {}).get('value')
-        )
-        previous_ratification_progress = (
-            "Not Set Yet" if fields.get('customfield_10136') is None or fields.get('customfield_10136', {}).get('value') in [None, "Not Set"]
-            else fields.get('customfield_10136', {}).get('value')
-        )
-        github = (
-            fields.get('customfield_10043', {}) if fields.get('customfield_10043') else "Not Set Yet"
-        )
-        bod_report = normalize_bod_report_value(fields.get('customfield_10037'))
-
-        # Collect issue information
-        parsed_issues.append({
-            'URL': url,
-            'ID': issue_id,
-            'Key': issue_key,
-            'Summary': summary,
-            'Status': status,
-            'BoD Report': bod_report,
-            'Updated': updated,
-            'GitHub': github,
-            'ISA or NON-ISA': isa_or_non_isa,
-            'Baseline Ratification Quarter': baseline_ratification_quarter,
-            'Target Ratification Quarter': target_ratification_quarter,
-            'Ratification Progress': ratification_progress,
-            'Previous Ratification Progress': previous_ratification_progress
-        })
-    return parsed_issues
+def normalize_progress_value(value):
+    return NOT_SET if value in [None, "Not Set"] else value
+
+
+# How each CSV column after 'Jira URL' is extracted from an issue's fields:
+# (CSV column, JIRA field, sub-key or None, default when unset, post-processing or None)
+FIELD_MAP = (
+    ('Summary', 'summary', None, None, None),
+    ('Status', 'status', 'name', None, None),
+    ('BoD Report', 'customfield_10037', None, None, normalize_bod_report_value),
+    ('Updated', 'updated', None, None, None),
+    ('ISA or NON-ISA?', 'customfield_10042', 'value', None, None),
+    ('GitHub', 'customfield_10043', None, NOT_SET, None),
+    ('Baseline Ratification Quarter', 'customfield_10039', 'value', NOT_SET, None),
+    ('Target Ratification Quarter', 'customfield_10040', 'value', NOT_SET, None),
+    ('Ratification Progress', 'customfield_10038', 'value', NOT_SET, normalize_progress_value),
+    ('Previous Ratification Progress', 'customfield_10136', 'value', NOT_SET, normalize_progress_value),
+)
+
 
 def get_data_from_jira(jira_token, jira_email):
     """
@@ -95,95 +62,11 @@ def get_data_from_jira(jira_token, jira_email):
 
     Parameters:
     jira_token (str): The JIRA token used for authentication.
+    jira_email (str): The JIRA account the token belongs to.
     """
-    print("Fetching data from JIRA...")
-    jira = Jira(
-        url="https://riscv.atlassian.net",
-        username=jira_email,
-        password=jira_token,
-        cloud=True
-    )
-
-    # JQL query to fetch required issues
-    jql = ('project = RVS AND '
-           'issuetype not in subTaskIssueTypes() '
-           'ORDER BY priority DESC, updated DESC')
-
-    # Extract issues from the JSON data
-    all_issues = jira.jql(jql)
-    issues = all_issues.get('issues', [])
-    parsed_issues = parse_issues(issues)
-
     # Generating the CSV filename with current date and time
-    print("Generating csv file...")
     csv_filename = f"specs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-
-    # Open (or create) a CSV file and write data to it
-    with open(csv_filename, 'w', newline='') as file:
-        writer = csv.writer(file, quotechar="'", quoting=csv.QUOTE_MINIMAL)
-        # Writing the header row
-        writer.writerow([
-            'Jira URL',
-            'Summary',
-            'Status',
-            'BoD Report',
-            'Updated',
-            'ISA or NON-ISA?',
-            'GitHub',
-            'Baseline Ratification Quarter',
-            'Target Ratification Quarter',
-            'Ratification Progress',
-            'Previous Ratification Progress'
-        ])
-
-        # Writing each issue to the CSV file
-        for issue in parsed_issues:
-            if issue['Status'] != "Specification Ratified" and issue['Status'] != "Specification Not Ratified":
-                writer.writerow([
-                    issue['URL'],
-                    issue['Summary'],
-                    issue['Status'],
-                    issue['BoD Report'],
-                    issue['Updated'],
-                    issue['ISA or NON-ISA'],
-                    issue['GitHub'],
-                    issue['Baseline Ratification Quarter'],
-                    issue['Target Ratification Quarter'],
-                    issue['Ratification Progress'],
-                    issue['Previous Ratification Progress']
-                ])
-
-    print(f"Data successfully written to {csv_filename}")
-
-
-def get_csv_content(csv_filepath):
-    """
-    Read a CSV file and return its content as a list of rows.
-
-    Parameters:
-    csv_filepath (str): The path to the CSV file.
-
-    Returns:
-    list: List of rows from the CSV file.
-    """
-    with open(csv_filepath, 'r') as csv_file:
-        csv_reader = csv.reader(csv_file, quotechar="'")
-        return list(csv_reader)
-
-
-def read_csv_file(file_path):
-    """
-    Function to read a CSV file and return its content as a list of rows.
-
-    Parameters:
-    file_path (str): The path to the CSV file.
-
-    Returns:
-    list: List of rows from the CSV file.
-    """
-    with open(file_path, 'r') as csv_file:
-        csv_reader = csv.reader(csv_file)
-        return list(csv_reader)
+    export(JQL, FIELD_MAP, csv_filename, (jira_email, jira_token))
 
 
 def main():
@@ -0,0 +1,143 @@
+"""
+Shared machinery for exporting JIRA issues to CSV.
+
+Issues matching a JIRA Query Language (JQL) query are fetched page by page,
+turned into rows through a field map and streamed into a CSV file. Scripts
+such as get-specs-data.py only provide the query, the field map and the
+output path.
+
+A field map is a sequence of
+(CSV column, JIRA field, sub-key or None, default when unset, post-processing or None)
+entries; the generated CSV starts with a 'Jira URL' column followed by one
+column per entry, in order.
+"""
+
+import csv
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from atlassian import Jira
+
+JIRA_URL = "https://riscv.atlassian.net"
+JIRA_BROWSE_URL = JIRA_URL + "/browse/"
+
+# Issues requested per search page; JIRA may return fewer, so paging
+# always follows nextPageToken rather than counting issues.
+PAGE_SIZE = 200
+
+
+def extract_field_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return value.get('value') or value.get('name') or value.get('label') or ""
+    if isinstance(value, list):
+        parts = [extract_field_value(item) for item in value]
+        return ", ".join([part for part in parts if part])
+    return str(value)
+
+
+def _extract(fields, key, subkey, default):
+    value = fields.get(key)
+    if not value:
+        return default
+    return value.get(subkey, default) if subkey else value
+
+
+def csv_columns(field_map):
+    """
+    Return the header row of the CSV generated for the given field map.
+    """
+    return ['Jira URL'] + [column for column, _, _, _, _ in field_map]
+
+
+# Function to parse and extract issue details, one CSV row per issue
+def parse_issues(issues, field_map):
+    for issue in issues:
+        fields = issue.get('fields') or {}
+        row = [JIRA_BROWSE_URL + issue.get('key')]
+        for _, key, subkey, default, transform in field_map:
+            value = _extract(fields, key, subkey, default)
+            row.append(transform(value) if transform else value)
+        yield row
+
+
+def fetch_page(jira, jql, fields, next_page_token):
+    """
+    Fetch one page of search results.
+
+    Parameters:
+    jira (Jira): The authenticated JIRA client.
+    jql (str): The JQL query.
+    fields (list): The JIRA fields to return; everything else is never transferred.
+    next_page_token (str): Token returned by the previous page, None for the first.
+
+    Returns:
+    dict: The search response.
+    """
+    return jira.enhanced_jql(
+        jql,
+        fields=fields,
+        nextPageToken=next_page_token,
+        limit=PAGE_SIZE
+    )
+
+
+def fetch_issues(jira, jql, fields):
+    """
+    Yield every issue matching the JQL query, following JIRA's page tokens.
+
+    Pages are chained by nextPageToken, so they cannot be requested in
+    parallel; instead the next page is fetched in the background while the
+    caller works through the current one.
+
+    Parameters:
+    jira (Jira): The authenticated JIRA client.
+    jql (str): The JQL query.
+    fields (list): The JIRA fields to return.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(fetch_page, jira, jql, fields, None)
+        while pending is not None:
+            page = pending.result()
+            next_page_token = page.get('nextPageToken')
+            pending = executor.submit(fetch_page, jira, jql, fields, next_page_token) if next_page_token else None
+            yield from page.get('issues', [])
+
+
+def export(jql, field_map, output_path, auth):
+    """
+    Fetch the issues matching the JQL query and write them to a CSV file.
+
+    Parameters:
+    jql (str): The JQL query.
+    field_map (tuple): How each CSV column is extracted, see the module docstring.
+    output_path (str): The CSV file to write.
+    auth (tuple): The (email, token) pair used to authenticate to JIRA.
+    """
+    print("Fetching data from JIRA...")
+    jira_email, jira_token = auth
+
+    # Search responses are JSON and compress well; requests decodes them transparently
+    session = requests.Session()
+    session.headers['Accept-Encoding'] = 'gzip, deflate'
+    jira = Jira(
+        url=JIRA_URL,
+        username=jira_email,
+        password=jira_token,
+        cloud=True,
+        session=session
+    )
+
+    # Issues are fetched, parsed and written in a single streaming pass
+    fields = [key for _, key, _, _, _ in field_map]
+    rows = parse_issues(fetch_issues(jira, jql, fields), field_map)
+
+    # Open (or create) a CSV file and write data to it
+    print("Generating csv file...")
+    with open(output_path, 'w', newline='') as file:
+        writer = csv.writer(file, quotechar="'", quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(csv_columns(field_map))
+        writer.writerows(rows)
+
+    print(f"Data successfully written to {output_path}")
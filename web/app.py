@@ -1,13 +1,23 @@
+import hashlib
+import io
+import json
 import os
+import re
+import tempfile
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
 
+import orjson
 import pandas as pd
 import requests
-from flask import Flask, render_template
-
-# PyGithub (modern auth)
-from github import Github, Auth
+from flask import Flask, make_response, render_template, request
+from flask_compress import Compress
+from jinja2 import FileSystemBytecodeCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # --- Config / Env ----------------------------------------------------------------
 
@@ -18,36 +28,137 @@ if not GITHUB_TOKEN:
 REPO_NAME = "riscv-admin/bod-report"
 ASSET_PREFIX = "specs_"
 ASSET_SUFFIX = ".csv"
-
-# Expected CSV schema (for sanity checks / future use if needed)
-EXPECTED_COLUMNS = [
+LATEST_RELEASE_URL = f"https://api.github.com/repos/{REPO_NAME}/releases/latest"
+
+# Release assets are named after the time the data was exported from JIRA
+ASSET_TIME_FORMAT = f"{ASSET_PREFIX}%Y%m%d_%H%M%S{ASSET_SUFFIX}"
+
+# Sidecar remembering the validators (ETag / Last-Modified) of downloaded assets.
+# Named apart from get-release-from-gh.py's sidecar, whose entries differ
+ETAG_CACHE_FILE = ".web-etag-cache.json"
+# Sidecar entry for the releases/latest response: {etag, asset: {id, name, url}}
+LATEST_RELEASE_KEY = "latest_release"
+
+# How long a loaded release is served from memory before GitHub is asked again
+CACHE_TTL_SECONDS = 300
+
+# After a failed refresh, the stale release is served this long before GitHub is tried again
+REFRESH_RETRY_SECONDS = 60
+
+# Load the release in a background thread at startup and refresh it every
+# CACHE_TTL_SECONDS / 2, so requests are served from memory (set to 0 to disable)
+WARM_CACHE = os.getenv("WARM_CACHE", "1") == "1"
+
+# Suffix of the prepared-DataFrame snapshot saved for each downloaded asset
+PARQUET_SUFFIX = ".parquet"
+
+# Asset bodies are streamed into memory in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Expected CSV schema: column -> dtype. Free text is "string"; columns drawn
+# from a small set of JIRA values are "category"
+EXPECTED_COLUMNS = {
+    "Jira URL": "string",
+    "Summary": "string",
+    "Status": "category",
+    "ISA or NON-ISA?": "category",
+    "GitHub": "string",
+    "Baseline Ratification Quarter": "category",
+    "Target Ratification Quarter": "category",
+    "Ratification Progress": "category",
+    "Previous Ratification Progress": "category",
+    "BoD Report": "category",
+}
+
+# Parse only the columns the report uses, with their declared dtypes so no type
+# inference runs; empty cells stay "" instead of becoming NA
+CSV_READ_OPTIONS = {
+    "usecols": lambda column: column in EXPECTED_COLUMNS,
+    "dtype": EXPECTED_COLUMNS,
+    "keep_default_na": False,
+}
+
+# Statuses of specs that are dropped from the report
+_CANCELLED_RE = re.compile(r"\bcancelled\b", re.IGNORECASE)
+
+# Where compiled templates are cached; unset means a private directory under the system temp dir
+JINJA_CACHE_DIR = os.getenv("JINJA_CACHE_DIR")
+
+# Columns the template reads; everything else is dropped from the prepared frame
+RENDER_COLUMNS = [
     "Jira URL",
     "Summary",
-    "Status",
     "ISA or NON-ISA?",
-    "GitHub",
-    "Baseline Ratification Quarter",
-    "Target Ratification Quarter",
+    "CurrentPhase",
+    "CurrentPhaseIndex",
+    "Planned Ratification Quarter",
+    "Trending Ratification Quarter",
     "Ratification Progress",
     "Previous Ratification Progress",
-    "BoD Report",
+    "GitHub",
+    "BoD Report Flag",
 ]
 
+# Display/sort order of the "Ratification Progress" column
+RATIFICATION_PROGRESS_ORDER = ["Late", "Exposed", "On Track", "Completed"]
+
 # --- Flask -----------------------------------------------------------------------
 
 app = Flask(__name__)
+# Compiled template bytecode survives restarts and is shared by all workers
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=JINJA_CACHE_DIR)
+# gzip/deflate/br responses according to the client's Accept-Encoding
+Compress(app)
+
+# Last parsed release: served directly while younger than CACHE_TTL_SECONDS
+# (or for as long as the warmer keeps it current), and reused when GitHub
+# answers 304 Not Modified
+_CACHE = {"df": None, "asset_name": None, "fetched_at": 0.0, "retry_after": 0.0}
+# Held only while _CACHE entries are swapped, never across a GitHub call
+_CACHE_LOCK = threading.Lock()
+# Serializes refreshes, so a release is downloaded and parsed once at a time
+_REFRESH_LOCK = threading.Lock()
+
+# Background thread keeping _CACHE current, see ensure_cache_warmer()
+_WARMER: Optional[threading.Thread] = None
+_WARMER_LOCK = threading.Lock()
+
+# Snapshot written for the release served last, replaced when a new release is prepared
+_LAST_SNAPSHOT_PATH: Optional[str] = None
+
+# The page rendered from the cached frame, re-rendered only when the frame changes
+_RENDERED = {"df": None, "html": None, "etag": None}
+
+# One session for every GitHub call, kept for the app's lifetime so TCP+TLS
+# connections to api.github.com and the asset CDN are pooled across requests
+_HTTP = requests.Session()
+_HTTP.headers.update({
+    "Authorization": f"token {GITHUB_TOKEN}",
+    "Accept-Encoding": "gzip, deflate",
+})
+# Transient GitHub/CDN failures are retried on the pooled connection instead
+# of failing the page; the final response is returned for normal handling
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    ),
+))
 
 # --- Helpers ---------------------------------------------------------------------
 
 
-def remove_existing_csv_files() -> None:
-    """Purge any prior CSVs to avoid stale reads."""
-    for file in os.listdir("."):
-        if file.endswith(".csv"):
-            try:
-                os.remove(file)
-            except Exception as e:
-                print(f"Warning: failed to remove {file}: {e}")
+def release_time(asset_name: str) -> Optional[datetime]:
+    """When the release's data was exported, read from the asset name; None if it has no timestamp."""
+    try:
+        return datetime.strptime(asset_name, ASSET_TIME_FORMAT)
+    except ValueError:
+        return None
 
 
 def is_bod_report(value) -> bool:
@@ -63,62 +174,174 @@ def is_bod_report(value) -> bool:
     return "yes" in normalized
 
 
-def download_csv_from_github() -> Optional[str]:
-    """Download the latest release CSV asset matching prefix/suffix."""
+def load_etag_cache() -> dict:
+    """Read the ETag sidecar; a missing or corrupt file is treated as empty."""
+    try:
+        with open(ETAG_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def replace_atomically(path: str, write: Callable[[str], None]) -> None:
+    """
+    Have `write` fill a temp file next to `path`, then move it into place.
+    The temp name is unique per call, so workers saving the same file at
+    once never clobber each other's temp file, and readers only ever see a
+    complete file.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)),
+        prefix=os.path.basename(path) + ".",
+        suffix=".tmp",
+    )
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_etag_cache(etag_cache: dict) -> None:
+    """Write the ETag sidecar atomically."""
+    def write(tmp_path: str) -> None:
+        with open(tmp_path, "w") as f:
+            json.dump(etag_cache, f, indent=2)
+
+    replace_atomically(ETAG_CACHE_FILE, write)
+
+
+def download_csv_from_github(force: bool = False) -> Tuple[Optional[str], Optional[bytes]]:
+    """
+    Download the latest release CSV asset matching prefix/suffix into memory.
+
+    Returns (asset_name, csv_bytes); csv_bytes is None when GitHub answered
+    304 Not Modified (for the release or the asset) and a prepared copy of
+    that asset is already held, see has_prepared_copy(). With force=True the
+    asset is downloaded unconditionally.
+    """
     try:
-        gh = Github(auth=Auth.Token(GITHUB_TOKEN))
-        repo = gh.get_repo(REPO_NAME)
-        latest_release = repo.get_latest_release()
-
-        csv_assets = [
-            asset for asset in latest_release.get_assets()
-            if asset.name.startswith(ASSET_PREFIX) and asset.name.endswith(ASSET_SUFFIX)
-        ]
-        if not csv_assets:
-            raise RuntimeError("No CSV assets found in the latest release.")
-
-        asset = csv_assets[0]
-        remove_existing_csv_files()
-
-        headers = {
-            "Authorization": f"token {GITHUB_TOKEN}",
-            "Accept": "application/octet-stream",
-        }
-        resp = requests.get(asset.url, headers=headers, timeout=60)
-        if resp.status_code != 200:
-            raise RuntimeError(f"Failed to download asset: {resp.status_code}, {resp.text}")
-
-        csv_filename = asset.name
-        with open(csv_filename, "wb") as f:
-            f.write(resp.content)
-
-        return csv_filename
+        etag_cache = load_etag_cache()
+
+        # Single REST call for the release and its asset list, made conditional
+        # on the last seen release: a 304 means the latest release is unchanged
+        release_headers = {"Accept": "application/vnd.github+json"}
+        cached_release = etag_cache.get(LATEST_RELEASE_KEY)
+        if cached_release and cached_release.get("etag") and not force:
+            release_headers["If-None-Match"] = cached_release["etag"]
+
+        release_resp = _HTTP.get(LATEST_RELEASE_URL, headers=release_headers, timeout=60)
+        if release_resp.status_code == 304:
+            asset = cached_release["asset"]
+        elif release_resp.status_code == 200:
+            # Only the first matching asset is used, so stop at it
+            csv_asset = next(
+                (
+                    asset for asset in orjson.loads(release_resp.content).get("assets", [])
+                    if asset["name"].startswith(ASSET_PREFIX) and asset["name"].endswith(ASSET_SUFFIX)
+                ),
+                None,
+            )
+            if csv_asset is None:
+                raise RuntimeError("No CSV assets found in the latest release.")
+
+            asset = {key: csv_asset[key] for key in ("id", "name", "url")}
+            etag_cache[LATEST_RELEASE_KEY] = {
+                "etag": release_resp.headers.get("ETag"),
+                "asset": asset,
+            }
+        else:
+            raise RuntimeError(f"Failed to fetch latest release: {release_resp.status_code}, {release_resp.text}")
+
+        cached = etag_cache.get(str(asset["id"])) if has_prepared_copy(asset["name"]) and not force else None
+
+        # Same release and its asset is already prepared: no need to ask for the asset
+        if release_resp.status_code == 304 and cached:
+            return asset["name"], None
+
+        headers = {"Accept": "application/octet-stream"}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        with _HTTP.get(asset["url"], headers=headers, timeout=60, stream=True) as resp:
+            if resp.status_code == 304:
+                save_etag_cache(etag_cache)
+                return asset["name"], None
+            if resp.status_code != 200:
+                raise RuntimeError(f"Failed to download asset: {resp.status_code}, {resp.text}")
+
+            buffer = io.BytesIO()
+            for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                buffer.write(chunk)
+
+            etag_cache[str(asset["id"])] = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+        save_etag_cache(etag_cache)
+
+        return asset["name"], buffer.getvalue()
 
     except Exception as e:
         print(f"Error downloading CSV from GitHub: {e}")
-        return None
+        return None, None
 
 
-def safe_read_csv(csv_filename: str) -> pd.DataFrame:
+def safe_read_csv(data: bytes) -> pd.DataFrame:
     """
     User-proof CSV loader:
-    - first try strict/fast parsing,
-    - on failure, retry with single-quote as quotechar,
-    - finally, retry with more tolerant settings.
+    - first try the pyarrow engine with the writer's single-quote quotechar,
+    - then strict/fast parsing with the C engine,
+    - on failure, retry with the tolerant python engine,
+    - finally, retry with the default quotechar.
+
+    Every attempt parses only EXPECTED_COLUMNS, with their dtypes (see CSV_READ_OPTIONS),
+    from a fresh in-memory buffer over `data`.
     """
     try:
-        # First attempt: normal, fast path
-        return pd.read_csv(csv_filename)
+        # First attempt: pyarrow engine, multithreaded and Arrow-backed. It does
+        # not accept a callable usecols, so the columns are projected afterwards.
+        df = pd.read_csv(
+            io.BytesIO(data),
+            engine="pyarrow",
+            dtype_backend="pyarrow",
+            quotechar="'",
+            dtype=EXPECTED_COLUMNS,
+            keep_default_na=False,
+        )
+        return df[[c for c in df.columns if c in EXPECTED_COLUMNS]]
+    except (ImportError, ValueError) as e:
+        print(f"[WARN] pyarrow CSV parse failed: {e}")
+        print("[INFO] Retrying with the C engine")
+
+    try:
+        # C engine, fast path; read in one pass rather than in chunks
+        return pd.read_csv(
+            io.BytesIO(data),
+            quotechar="'",
+            low_memory=False,
+            cache_dates=True,
+            **CSV_READ_OPTIONS,
+        )
     except pd.errors.ParserError as e:
         print(f"[WARN] Strict CSV parse failed: {e}")
         print("[INFO] Retrying with engine='python', quotechar=\"'\"")
 
         try:
             df = pd.read_csv(
-                csv_filename,
+                io.BytesIO(data),
                 engine="python",
                 on_bad_lines="warn",  # or "skip" if you prefer to drop bad rows
                 quotechar="'",
+                **CSV_READ_OPTIONS,
             )
             return df
         except pd.errors.ParserError as e2:
@@ -127,61 +350,249 @@ def safe_read_csv(csv_filename: str) -> pd.DataFrame:
 
             # Last resort for cases like 'Packed Single Instruction, Multiple Data - SIMD (P)'
             df = pd.read_csv(
-                csv_filename,
+                io.BytesIO(data),
                 engine="python",
                 on_bad_lines="warn",
+                **CSV_READ_OPTIONS,
             )
             return df
 
 
-def load_data() -> Optional[pd.DataFrame]:
-    """Load, normalize, sort."""
+def prepare_data(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize and sort a freshly parsed release."""
+    # Optional sanity log
+    missing = [c for c in EXPECTED_COLUMNS if c not in df.columns]
+    if missing:
+        print(f"[WARN] Missing expected columns in CSV: {missing}")
+
+    df.rename(
+        columns={
+            "Baseline Ratification Quarter": "Planned Ratification Quarter",
+            "Target Ratification Quarter": "Trending Ratification Quarter",
+        },
+        inplace=True,
+    )
+
+    # Short rows from the tolerant fallbacks can still hold NA; "" has to be a
+    # category before fillna can write it into a categorical column
+    for column in df.select_dtypes("category"):
+        if "" not in df[column].cat.categories:
+            df[column] = df[column].cat.add_categories("")
+
+    # Cancelled specs are dropped once here, so the cached frame never holds them
+    if "Status" in df.columns:
+        df = df[~df["Status"].str.contains(_CANCELLED_RE, na=False)]
+
+    # Empty cells become "" so neither the filters nor the template see NA
+    df = df.fillna("")
+
+    if "Status" in df.columns:
+        add_phase_columns(df)
+
+    if "BoD Report" not in df.columns:
+        df["BoD Report"] = ""
+    df["BoD Report Flag"] = df["BoD Report"].apply(is_bod_report)
+
+    # Sort by ratification progress + trending quarter. The ordered categorical
+    # sorts on its integer codes; values outside the known order (e.g.
+    # "Not Set Yet") are kept as extra categories after "Completed".
+    progress = df["Ratification Progress"]
+    extra = sorted(set(progress.dropna()) - set(RATIFICATION_PROGRESS_ORDER))
+    df["Ratification Progress"] = pd.Categorical(
+        progress, categories=RATIFICATION_PROGRESS_ORDER + extra, ordered=True
+    )
+    df.sort_values(
+        by=["Ratification Progress", "Trending Ratification Quarter"],
+        ascending=[True, True],
+        inplace=True,
+    )
+    return df[[c for c in RENDER_COLUMNS if c in df.columns]]
+
+
+def snapshot_path(asset_name: str) -> str:
+    return asset_name + PARQUET_SUFFIX
+
+
+def has_prepared_copy(asset_name: str) -> bool:
+    """True when the prepared frame for this asset is in memory or saved as a snapshot."""
+    in_memory = _CACHE["df"] is not None and _CACHE["asset_name"] == asset_name
+    return in_memory or os.path.exists(snapshot_path(asset_name))
+
+
+def read_parquet_snapshot(asset_name: str) -> Optional[pd.DataFrame]:
+    """Return the prepared frame saved for this asset, if any."""
+    parquet_path = snapshot_path(asset_name)
     try:
-        # csv_filename = download_csv_from_github()
-        csv_filename = "../specs_20260107_121735.csv"
-        if not csv_filename:
-            raise RuntimeError("CSV download failed, cannot load data.")
+        return pd.read_parquet(parquet_path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[WARN] Ignoring unreadable parquet snapshot {parquet_path}: {e}")
+        return None
 
-        df = safe_read_csv(csv_filename)
 
-        # Optional sanity log
-        missing = [c for c in EXPECTED_COLUMNS if c not in df.columns]
-        if missing:
-            print(f"[WARN] Missing expected columns in CSV: {missing}")
+def write_parquet_snapshot(df: pd.DataFrame, asset_name: str) -> None:
+    """Save the prepared frame so a restarted process can skip download and parse."""
+    parquet_path = snapshot_path(asset_name)
+    try:
+        replace_atomically(parquet_path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+    except Exception as e:
+        print(f"[WARN] Failed to write parquet snapshot {parquet_path}: {e}")
 
-        df.rename(
-            columns={
-                "Baseline Ratification Quarter": "Planned Ratification Quarter",
-                "Target Ratification Quarter": "Trending Ratification Quarter",
-            },
-            inplace=True,
-        )
 
-        # Normalize status strings
-        if "Status" in df.columns:
-            df["Status"] = df["Status"].fillna("").astype(str)
-
-        if "BoD Report" not in df.columns:
-            df["BoD Report"] = ""
-        df["BoD Report"] = df["BoD Report"].fillna("").astype(str)
-        df["BoD Report Flag"] = df["BoD Report"].apply(is_bod_report)
-
-        # Sort by ratification progress + trending quarter
-        sort_order = {"Late": 0, "Exposed": 1, "On Track": 2, "Completed": 3}
-        df["SortOrder"] = df.get("Ratification Progress", "").map(sort_order)
-        df.sort_values(
-            by=["SortOrder", "Trending Ratification Quarter"],
-            ascending=[True, True],
-            inplace=True,
-        )
-        df.drop(columns=["SortOrder"], errors="ignore", inplace=True)
+def last_seen_snapshot() -> Optional[str]:
+    """Snapshot path of the release recorded in the ETag sidecar by a previous run."""
+    asset = load_etag_cache().get(LATEST_RELEASE_KEY, {}).get("asset")
+    return snapshot_path(asset["name"]) if asset else None
+
+
+def remove_previous_snapshot(keep: str) -> None:
+    """Delete the snapshot of the previously served release, unless it is `keep`'s."""
+    previous = _LAST_SNAPSHOT_PATH
+    if not previous or previous == snapshot_path(keep):
+        return
+    try:
+        os.unlink(previous)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: failed to remove {previous}: {e}")
+
+
+def _fetch_data() -> Optional[pd.DataFrame]:
+    """Load, normalize, sort."""
+    global _LAST_SNAPSHOT_PATH
+    try:
+        # Must be read before the download records the new release in the sidecar
+        if _LAST_SNAPSHOT_PATH is None:
+            _LAST_SNAPSHOT_PATH = last_seen_snapshot()
 
+        asset_name, data = download_csv_from_github()
+        if not asset_name:
+            raise RuntimeError("CSV download failed, cannot load data.")
+
+        df = None
+        if data is None:
+            # Release unchanged: serve the frame we already have, or its
+            # snapshot after a restart
+            if _CACHE["df"] is not None and _CACHE["asset_name"] == asset_name:
+                return _CACHE["df"]
+            df = read_parquet_snapshot(asset_name)
+            if df is None:
+                asset_name, data = download_csv_from_github(force=True)
+                if data is None:
+                    raise RuntimeError("CSV download failed, cannot load data.")
+
+        if df is None:
+            df = prepare_data(safe_read_csv(data))
+            write_parquet_snapshot(df, asset_name)
+            remove_previous_snapshot(keep=asset_name)
+
+        # Travels with the frame, so a reader never pairs it with another release's name
+        df.attrs["asset_name"] = asset_name
+        with _CACHE_LOCK:
+            _CACHE["df"] = df
+            _CACHE["asset_name"] = asset_name
+        _LAST_SNAPSHOT_PATH = snapshot_path(asset_name)
         return df
 
     except Exception as e:
         print(f"Error loading data: {e}")
         return None
 
+
+def _refresh() -> Optional[pd.DataFrame]:
+    """
+    Fetch the release and restart the TTL; the caller holds _REFRESH_LOCK.
+    A failed refresh keeps serving the last good frame, if there is one.
+    """
+    df = _fetch_data()
+    if df is not None:
+        with _CACHE_LOCK:
+            _CACHE["fetched_at"] = time.monotonic()
+        return df
+    if _CACHE["df"] is not None:
+        print(
+            f"[WARN] Refresh failed, serving the cached copy of {_CACHE['asset_name']}"
+            f" for the next {REFRESH_RETRY_SECONDS}s"
+        )
+        # Keeps requests from each retrying GitHub (and its timeouts) during an outage
+        with _CACHE_LOCK:
+            _CACHE["retry_after"] = time.monotonic() + REFRESH_RETRY_SECONDS
+    return _CACHE["df"]
+
+
+def _is_fresh() -> bool:
+    return _CACHE["df"] is not None and time.monotonic() - _CACHE["fetched_at"] < CACHE_TTL_SECONDS
+
+
+def _backing_off() -> bool:
+    """True while a recent failed refresh says to keep serving the stale frame."""
+    return _CACHE["df"] is not None and time.monotonic() < _CACHE["retry_after"]
+
+
+def _warmer_running() -> bool:
+    return _WARMER is not None and _WARMER.is_alive()
+
+
+def load_data() -> Optional[pd.DataFrame]:
+    """
+    Serve the cached frame while it is fresh, otherwise refresh it.
+
+    Requests wait on GitHub only when nothing has been loaded yet: while the
+    warmer runs it owns refreshing, a stale frame is served as is while
+    another thread is already refreshing it, and for REFRESH_RETRY_SECONDS
+    after a refresh failed.
+    """
+    df = _CACHE["df"]
+    if df is not None and (_warmer_running() or _is_fresh() or _backing_off()):
+        return df
+
+    if not _REFRESH_LOCK.acquire(blocking=df is None):
+        return df
+    try:
+        # Another thread may have finished (or failed) a refresh while this one waited
+        if _is_fresh() or _backing_off():
+            return _CACHE["df"]
+        return _refresh()
+    finally:
+        _REFRESH_LOCK.release()
+
+
+def refresh_data() -> Optional[pd.DataFrame]:
+    """Refresh the cached frame regardless of its age."""
+    with _REFRESH_LOCK:
+        return _refresh()
+
+
+def _keep_cache_warm() -> None:
+    """
+    Load the release now, then refresh it every CACHE_TTL_SECONDS / 2, so the
+    cached frame is replaced well before it would go stale.
+    """
+    load_data()
+    while True:
+        time.sleep(CACHE_TTL_SECONDS / 2)
+        refresh_data()
+
+
+def ensure_cache_warmer() -> None:
+    """Start the warmer in this process, unless it is disabled or already running."""
+    global _WARMER
+    if not WARM_CACHE or _warmer_running():
+        return
+    with _WARMER_LOCK:
+        if not _warmer_running():
+            _WARMER = threading.Thread(target=_keep_cache_warm, name="cache-warmer", daemon=True)
+            _WARMER.start()
+
+
+def _after_fork_in_child() -> None:
+    """Threads do not survive fork() and locks may be inherited held: start afresh."""
+    global _CACHE_LOCK, _REFRESH_LOCK, _WARMER_LOCK
+    _CACHE_LOCK, _REFRESH_LOCK, _WARMER_LOCK = threading.Lock(), threading.Lock(), threading.Lock()
+    ensure_cache_warmer()
+
 # --- Jinja Filters ---------------------------------------------------------------
 
 WORKFLOW_PHASES = [
@@ -195,68 +606,127 @@ WORKFLOW_PHASES = [
 ]
 
 
+# (keywords, phase) pairs in precedence order: a status mentioning several
+# keywords gets the phase listed first, wherever the keywords appear in it
+STATUS_KEYWORDS = [
+    (("Ratification-Ready", "Rat-Ready"), "Ratification-Ready"),
+    (("Specification in Publication", "Publication"), "Specification in Publication"),
+    (("Freeze",), "Freeze"),
+    (("Stabilization",), "Stabilization"),
+    (("Under Development", "Development"), "Development"),
+    (("Planning",), "Planning"),
+    (("Inception",), "Inception"),
+    (("Cancelled",), "Cancelled"),
+]
+
+# One capture group per phase; the top-level alternation is tried in order and
+# each branch scans the whole status (DOTALL: across newlines too), which
+# preserves the precedence above
+STATUS_RE = re.compile(
+    "^(?:"
+    + "|".join(
+        ".*?(" + "|".join(re.escape(keyword) for keyword in keywords) + ")"
+        for keywords, _ in STATUS_KEYWORDS
+    )
+    + ")",
+    re.DOTALL,
+)
+
+# Matched keyword -> phase
+KEYWORD_PHASES = {keyword: phase for keywords, phase in STATUS_KEYWORDS for keyword in keywords}
+
+# Workflow phase -> its position in WORKFLOW_PHASES
+PHASE_INDEX = {phase: i for i, phase in enumerate(WORKFLOW_PHASES)}
+
+
+# Statuses come from a small fixed set, so repeated calls are dict lookups
+@lru_cache(maxsize=256)
 def parse_status(value: str) -> str:
     if not value:
         return value
 
     v = str(value)
+    match = STATUS_RE.match(v)
+    return KEYWORD_PHASES[match.group(match.lastindex)] if match else v
 
-    if "Ratification-Ready" in v or "Rat-Ready" in v:
-        return "Ratification-Ready"
-    if "Specification in Publication" in v or "Publication" in v:
-        return "Specification in Publication"
-    if "Freeze" in v:
-        return "Freeze"
-    if "Stabilization" in v:
-        return "Stabilization"
-    if "Under Development" in v or "Development" in v:
-        return "Development"
-    if "Planning" in v:
-        return "Planning"
-    if "Inception" in v:
-        return "Inception"
-    if "Cancelled" in v:
-        return "Cancelled"
-
-    return v
-
-
-def calculate_progress(status: str):
-    if not status:
-        return None, None
-
-    normalized = parse_status(status)
 
-    if normalized not in WORKFLOW_PHASES:
-        return normalized, None
+def add_phase_columns(df: pd.DataFrame) -> None:
+    """
+    parse_status() over the whole Status column, so the template reads
+    CurrentPhase/CurrentPhaseIndex instead of classifying every row on every
+    render. Only a handful of distinct statuses exist, so each is parsed once
+    and the result is mapped back onto the rows.
 
-    idx = WORKFLOW_PHASES.index(normalized)
-    next_phase = WORKFLOW_PHASES[idx + 1] if idx + 1 < len(WORKFLOW_PHASES) else "Ratified"
-    return normalized, next_phase
+    CurrentPhaseIndex is the phase's position in WORKFLOW_PHASES, -1 for a
+    status outside the workflow.
+    """
+    status = df["Status"]
+    phases = {value: parse_status(value) for value in status.unique()}
+    df["CurrentPhase"] = status.map(phases)
+    df["CurrentPhaseIndex"] = df["CurrentPhase"].map(PHASE_INDEX).fillna(-1).astype(int)
 
 
+app.jinja_env.globals["workflow_phases"] = WORKFLOW_PHASES
 app.jinja_env.filters["parse_status"] = parse_status
-app.jinja_env.filters["calculate_progress"] = calculate_progress
 
 # --- Routes ----------------------------------------------------------------------
 
 
+# Safety net for processes the two startup paths below did not cover
+app.before_request(ensure_cache_warmer)
+
+
 @app.route("/")
 def index():
     data = load_data()
     if data is None:
         return "Failed to load data.", 500
 
-    # FILTER CANCELLED SPECS
-    if "Status" in data.columns:
-        mask = ~data["Status"].fillna("").str.contains(r"\bcancelled\b", case=False, regex=True)
-        data = data[mask].copy()
-
-    last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    return render_template("index.html", data=data, last_updated=last_updated)
+    global _RENDERED
+    rendered = _RENDERED
+    if rendered["df"] is not data:
+        # Everything on the page comes from the release, never from when or where
+        # it was loaded, so every worker renders the same page under the same ETag
+        asset_name = data.attrs["asset_name"]
+        exported_at = release_time(asset_name)
+        last_updated = exported_at.strftime("%Y-%m-%d %H:%M:%S") if exported_at else asset_name
+        # Plain dicts keep the template's row['Column'] lookups off pandas' indexing machinery
+        rows = data.to_dict("records")
+        html = render_template("index.html", rows=rows, last_updated=last_updated)
+        # The release names the tag; the digest covers template changes between deploys
+        digest = hashlib.sha1(html.encode("utf-8")).hexdigest()[:16]
+        etag = f"{asset_name.removesuffix(ASSET_SUFFIX)}-{digest}"
+        rendered = _RENDERED = {"df": data, "html": html, "etag": etag}
+
+    # Weak, because the bytes on the wire depend on the negotiated Content-Encoding
+    # (flask-compress leaves weak validators untouched)
+    if request.if_none_match.contains_weak(rendered["etag"]):
+        response = make_response("", 304)
+    else:
+        response = make_response(rendered["html"])
+    response.set_etag(rendered["etag"], weak=True)
+    response.headers["Cache-Control"] = f"public, max-age={CACHE_TTL_SECONDS}"
+    return response
+
+# Under `gunicorn --preload` the app is imported once in the master; loading the
+# release there lets every forked worker start with the frame already in memory.
+# The pooled connections are dropped first so workers never share a socket.
+if os.getenv("PRELOAD"):
+    load_data()
+    _HTTP.close()
+
+# Every forked process (e.g. a Gunicorn worker) starts its own warmer. The
+# importing process starts one right away, unless it just preloaded the release:
+# a preloading Gunicorn master only forks, and should not fork with a live thread.
+# Any process serving requests without a warmer starts one on its first request.
+os.register_at_fork(after_in_child=_after_fork_in_child)
+if not os.getenv("PRELOAD"):
+    ensure_cache_warmer()
 
 # --- Main ------------------------------------------------------------------------
 
 
+# Development server only; production runs
+#   PRELOAD=1 gunicorn -w 4 --preload --bind 0.0.0.0:5031 app:app
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=5001)
+    app.run(host="0.0.0.0", port=5001)